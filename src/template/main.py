@@ -1,40 +1,105 @@
+import functools
 import json
-from collections import defaultdict
+import logging
+import logging.handlers
+import sys
 import datetime as dt
+import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # backend de rasterizado puro; evita todo costo de GUI
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import os
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba es opcional; sin él se usa la ruta vectorizada
+    njit = None
+    prange = range
+
+try:
+    import orjson as _json  # analizador JSON nativo, varias veces más rápido
+except ImportError:  # orjson es opcional; el módulo estándar da el mismo resultado
+    _json = json
+
+try:
+    from vispy import scene as _vispy_scene  # backend GPU para inspección interactiva
+except ImportError:  # vispy es opcional; matplotlib cubre la salida estática
+    _vispy_scene = None
+
+# Logger con salida amortiguada: print (y StreamHandler a secas, que hace
+# flush tras cada registro) paga un flush síncrono por línea, lo que se nota
+# al guardar muchas figuras en bucle. MemoryHandler acumula los registros y
+# los vuelca por lotes: al llenarse el búfer, ante un error, o en el
+# logging.shutdown del final del programa
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    logger.addHandler(logging.handlers.MemoryHandler(
+        256, target=logging.StreamHandler(sys.stdout)))
+    logger.setLevel(logging.INFO)
+
 # Variable global para la ruta de datos (ajústala según tu estructura de directorio)
 data_dir = "../data"
 
+# Una semana, construida una sola vez: se usa al cerrar el span de resaltado
+ONE_WEEK = dt.timedelta(days=7)
+
+@functools.lru_cache(maxsize=8)
+def _load_json(json_file, mtime):
+    """Lee y parsea un archivo JSON, cacheado por (ruta, mtime).
+
+    El mtime forma parte de la clave para que un archivo regenerado
+    invalide su entrada; aperturas repetidas durante una misma corrida
+    se resuelven desde memoria en lugar de disco.
+    """
+    with open(json_file, 'rb') as f:
+        return _json.loads(f.read())
+
+@functools.lru_cache(maxsize=256)
+def _parse_ymd(s):
+    """Parsea una fecha 'YYYY-MM-DD'; cacheado porque las mismas cadenas
+    (p. ej. las fechas de resaltado) se reparsean en cada función plot_*."""
+    return dt.datetime.strptime(s, "%Y-%m-%d")
+
+@functools.lru_cache(maxsize=1024)
+def _week_label(year, week):
+    """Formatea una etiqueta de semana ISO 'YYYY-Www' con caché."""
+    return f"{year}-W{week:02d}"
+
+# Caché de resultados ya procesados, clave (función, archivo, parámetros, mtime).
+# Se devuelve la misma referencia sin copiar: los llamadores solo leen los dicts.
+_proc_cache = {}
+
+def clear_cache():
+    """Vacía los cachés de archivos JSON y de resultados procesados."""
+    _proc_cache.clear()
+    _load_json.cache_clear()
+
 def load_and_process_data(json_file, window_size=7):
     """Carga y procesa los datos de un archivo JSON, sin eliminar ningún dato."""
     try:
-        # Cargar datos
-        with open(json_file, 'r') as f:
-            data = json.load(f)
+        mtime = os.path.getmtime(json_file)
+        cache_key = ('daily', json_file, window_size, mtime)
+        if cache_key in _proc_cache:
+            return _proc_cache[cache_key]
+
+        # Cargar datos (cacheado por ruta y mtime)
+        data = _load_json(json_file, mtime)
+
+        # Aplanar los registros de todos los usuarios, sin filtrar ningún
+        # período; la agregación se hace después con NumPy en lugar de
+        # acumular en diccionarios registro por registro
+        all_dates = []
+        all_cnts = []
+        for stats in data.values():
+            daily = stats.get("daily_commits", {})
+            all_dates.extend(daily.keys())
+            all_cnts.extend(daily.values())
 
-        # Diccionarios para almacenar datos procesados
-        commits_by_day = defaultdict(int)
-        active_users_by_day = defaultdict(set)
-        
-        # Procesar los datos de cada usuario, sin filtrar ningún período
-        for user_id, stats in data.items():
-            for fecha_str, cnt in stats.get("daily_commits", {}).items():
-                current_date_obj = dt.datetime.strptime(fecha_str, "%Y-%m-%d")
-                
-                # Acumular datos sin filtrar
-                commits_by_day[fecha_str] += cnt
-                if cnt > 0:
-                    active_users_by_day[fecha_str].add(user_id)
-
-        # Ordenar fechas
-        fechas = sorted(commits_by_day.keys())
-        
         # Manejar caso de datos vacíos
-        if not fechas:
+        if not all_dates:
             return {
                 'fechas': [],
                 'commits_rolling_avg': [],
@@ -43,61 +108,54 @@ def load_and_process_data(json_file, window_size=7):
                 'raw_users': []
             }
 
+        # Factorizar los días (np.unique los ordena) y agregar con bincount;
+        # cada par (usuario, día) aparece a lo sumo una vez en el JSON, así
+        # que los usuarios activos por día son los registros con cnt > 0
+        uniq_days, inv = np.unique(np.asarray(all_dates), return_inverse=True)
+        cnts = np.asarray(all_cnts, dtype=np.int64)
+        # Los conteos por día son enteros pequeños: int32 basta y reduce a la
+        # mitad el ancho de banda de memoria de las pasadas posteriores
+        counts = np.bincount(inv, weights=cnts).astype(np.int32)
+        active_users = np.bincount(inv[cnts > 0], minlength=len(uniq_days)).astype(np.int32)
+
         # Convertir fechas a objetos datetime
-        fechas_dt = [dt.datetime.strptime(f, "%Y-%m-%d") for f in fechas]
-        counts = [commits_by_day[f] for f in fechas]
-        active_users = [len(active_users_by_day[f]) for f in fechas]
+        fechas = uniq_days.tolist()
+        fechas_dt = [_parse_ymd(f) for f in fechas]
 
         # Crear serie temporal completa con fechas faltantes
         if len(fechas_dt) > 1:
-            # Determinar rango de fechas
-            current_date_fill = fechas_dt[0] 
-            end_date_fill = fechas_dt[-1]
-            
-            # Generar todas las fechas en el rango
-            date_range = []
-            while current_date_fill <= end_date_fill:
-                date_range.append(current_date_fill)
-                current_date_fill += dt.timedelta(days=1)
-            
-            # Completar series con valores para todas las fechas
-            complete_counts = []
-            complete_users = []
-            complete_dates = []
-            
-            for date_in_range in date_range:
-                date_str = date_in_range.strftime("%Y-%m-%d")
-                complete_dates.append(date_in_range)
-                
-                # Asignar valor real o cero según exista datos
-                if date_str in commits_by_day:
-                    complete_counts.append(commits_by_day[date_str])
-                    complete_users.append(len(active_users_by_day[date_str]))
-                else:
-                    complete_counts.append(0)
-                    complete_users.append(0)
-            
-            # Reemplazar series originales con series completas
-            fechas_dt = complete_dates
-            counts = complete_counts
-            active_users = complete_users
-        elif not fechas_dt:
-             counts = []
-             active_users = []
+            # Rango denso como datetime64[D]: ninguna conversión a cadena por
+            # día; la posición de cada día observado es su distancia al inicio
+            days64 = uniq_days.astype('datetime64[D]')
+            start_d = days64[0]
+            n_days = (days64[-1] - start_d).astype(int) + 1
+
+            dense_counts = np.zeros(n_days, dtype=np.int32)
+            dense_users = np.zeros(n_days, dtype=np.int32)
+            pos = (days64 - start_d).astype(int)
+            dense_counts[pos] = counts
+            dense_users[pos] = active_users
+
+            counts = dense_counts
+            active_users = dense_users
+            # Materializar objetos datetime solo una vez, al final
+            fechas_dt = list((start_d + np.arange(n_days)).astype('datetime64[s]').astype('O'))
 
         # Calcular promedios móviles
         commits_rolling_avg = calculate_rolling_average(counts, window_size)
         users_rolling_avg = calculate_rolling_average(active_users, window_size)
         
-        return {
+        result = {
             'fechas': fechas_dt,
             'commits_rolling_avg': commits_rolling_avg,
             'users_rolling_avg': users_rolling_avg,
             'raw_commits': counts,  # Datos sin promediar
             'raw_users': active_users
         }
+        _proc_cache[cache_key] = result
+        return result
     except Exception as e:
-        print(f"Error procesando {json_file}: {e}")
+        logger.warning(f"Error procesando {json_file}: {e}")
         return {
             'fechas': [],
             'commits_rolling_avg': [],
@@ -106,79 +164,139 @@ def load_and_process_data(json_file, window_size=7):
             'raw_users': []
         }
 
+def _roll_mean(a, w):
+    """Promedio móvil; cada salida suma su propia ventana (las iteraciones son
+    independientes, así que numba puede repartirlas entre núcleos)."""
+    n = a.shape[0]
+    out = np.empty(n, dtype=np.float32)
+    for i in prange(n):
+        lo = i - w + 1
+        if lo < 0:
+            lo = 0
+        s = 0.0  # acumulador de 64 bits: evita desbordes con entrada int32
+        for j in range(lo, i + 1):
+            s += a[j]
+        out[i] = s / (i + 1 if i < w else w)
+    return out
+
+
+def _pct_change(a):
+    """Cambio porcentual día a día con el mismo convenio que la ruta
+    vectorizada: 0% si ayer y hoy son 0, 100% si solo ayer fue 0."""
+    n = a.shape[0] - 1
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        prev = a[i]
+        cur = a[i + 1]
+        if prev != 0:
+            out[i] = (cur - prev) / prev * 100.0
+        elif cur == 0:
+            out[i] = 0.0
+        else:
+            out[i] = 100.0
+    return out
+
+
+if njit is not None:
+    # Compilados una sola vez por proceso; el caché evita recompilar en
+    # corridas posteriores
+    _roll_mean = njit(cache=True, fastmath=True, parallel=True)(_roll_mean)
+    _pct_change = njit(cache=True, fastmath=True, parallel=True)(_pct_change)
+
+
 def calculate_rolling_average(data_series, window_size):
     """Calcula el promedio móvil para una serie de datos"""
-    rolling_avg = []
-    
-    if not data_series:
-        return rolling_avg
-        
-    for i in range(len(data_series)):
-        if i < window_size - 1:
-            rolling_avg.append(np.mean(data_series[:i+1]))
-        else:
-            rolling_avg.append(np.mean(data_series[i-window_size+1:i+1]))
-    
-    return rolling_avg
+    # Se conserva el dtype de entrada (p. ej. int32) hasta el kernel; el
+    # resultado se emite en float32, suficiente para conteos de actividad
+    a = np.asarray(data_series)
+
+    if a.size == 0:
+        return a.astype(np.float32)
+
+    if njit is not None:
+        return _roll_mean(a, window_size)
+
+    # Ruta alternativa sin numba: suma acumulada con un cero inicial
+    # para poder restar la ventana desplazada
+    c = np.concatenate(([0.0], np.cumsum(a, dtype=np.float64)))
+
+    # Región inicial: promedio sobre los elementos disponibles (ventana incompleta)
+    ramp = c[1:window_size] / np.arange(1, min(window_size, a.size + 1))
+
+    # Región estable: ventana completa de tamaño window_size
+    ss = (c[window_size:] - c[:-window_size]) / window_size
+
+    return np.concatenate((ramp, ss)).astype(np.float32)
 
 def calculate_weekly_data(json_file):
     """Calcula datos semanales de commits y usuarios activos."""
     try:
-        with open(json_file, 'r') as f:
-            data = json.load(f)
-        
-        # Preparar estructuras de datos para agregación semanal
-        commits_by_week = defaultdict(int)
-        active_users_by_week = defaultdict(set)
+        mtime = os.path.getmtime(json_file)
+        cache_key = ('weekly', json_file, mtime)
+        if cache_key in _proc_cache:
+            return _proc_cache[cache_key]
+
+        data = _load_json(json_file, mtime)
         
-        # Procesar datos de cada usuario, sin filtrar
-        for user_id, stats in data.items():
+        # Recolectar todos los registros (usuario, fecha, conteo) en una sola
+        # pasada ligera; la agregación pesada se hace después con NumPy
+        all_dates = []
+        all_cnts = []
+        all_users = []
+        for user_idx, stats in enumerate(data.values()):
             for fecha_str, cnt in stats.get("daily_commits", {}).items():
-                date_obj = dt.datetime.strptime(fecha_str, "%Y-%m-%d")
-                
-                # Determinar clave de semana (ISO)
-                year, week, _ = date_obj.isocalendar()
-                week_key = f"{year}-W{week:02d}"
-                
-                # Acumular datos por semana
-                commits_by_week[week_key] += cnt
-                if cnt > 0:
-                    active_users_by_week[week_key].add(user_id)
-        
-        # Ordenar semanas
-        weeks = sorted(commits_by_week.keys())
-        
+                all_dates.append(fecha_str)
+                all_cnts.append(cnt)
+                all_users.append(user_idx)
+
         # Manejar caso de datos vacíos
-        if not weeks:
+        if not all_dates:
             return {
                 'fechas': [],
                 'commits': [],
                 'active_users': [],
                 'week_labels': []
             }
-        
-        # Convertir etiquetas de semana a fechas (primer día de cada semana)
-        week_dates = []
-        for week_key in weeks:
-            year_str, week_str = week_key.split('-W')
-            year = int(year_str)
-            week_num = int(week_str)
-            # Usar formato ISO para semanas: el lunes es el primer día
-            date = dt.datetime.strptime(f"{year}-{week_num}-1", "%G-W%V-%u")
-            week_dates.append(date)
-        
-        # Extraer datos de conteos
-        week_commits = [commits_by_week[w] for w in weeks]
-        week_users = [len(active_users_by_week[w]) for w in weeks]
-        
-        return {
-            'fechas': week_dates,
+
+        # Lunes ISO de cada registro por aritmética de días: el epoch
+        # 1970-01-01 cae jueves (índice 3 con lunes = 0)
+        dates = np.asarray(all_dates, dtype='datetime64[D]')
+        days = dates.view('i8')
+        week_start = dates - ((days + 3) % 7).astype('timedelta64[D]')
+
+        # Factorizar semanas (np.unique las deja en orden cronológico) y
+        # agregar los commits por semana con una sola pasada de bincount
+        uniq_weeks, inv = np.unique(week_start, return_inverse=True)
+        cnts = np.asarray(all_cnts, dtype=np.int64)
+        # Conservar las series como ndarrays int32: los ayudantes de
+        # graficado las reducen (max) y las dibujan sin reconvertir
+        week_commits = np.bincount(inv, weights=cnts).astype(np.int32)
+
+        # Usuarios activos: pares únicos (usuario, semana) con actividad
+        users = np.asarray(all_users, dtype=np.int64)
+        active = cnts > 0
+        pair_keys = users[active] * len(uniq_weeks) + inv[active]
+        week_users = np.bincount(np.unique(pair_keys) % len(uniq_weeks),
+                                 minlength=len(uniq_weeks)).astype(np.int32)
+
+        # Etiquetas ISO (una iteración por semana, no por registro)
+        weeks = []
+        for d in uniq_weeks.astype('O'):
+            year, week, _ = d.isocalendar()
+            weeks.append(_week_label(year, week))
+
+        result = {
+            # Las fechas se quedan como datetime64[D]: matplotlib las
+            # convierte en bloque en vez de objeto por objeto al graficar
+            'fechas': uniq_weeks,
             'commits': week_commits,
             'active_users': week_users,
             'week_labels': weeks
         }
+        _proc_cache[cache_key] = result
+        return result
     except Exception as e:
-        print(f"Error procesando datos semanales de {json_file}: {e}")
+        logger.warning(f"Error procesando datos semanales de {json_file}: {e}")
         return {
             'fechas': [],
             'commits': [],
@@ -186,49 +304,113 @@ def calculate_weekly_data(json_file):
             'week_labels': []
         }
 
+# Formateador y localizador compartidos por las gráficas diarias: instanciar
+# estos objetos de matplotlib en cada gráfica es sorprendentemente caro
+_FORMATTER = mdates.DateFormatter('%Y-%m-%d')
+_LOCATOR = mdates.WeekdayLocator(interval=2)
+
+def _finalize_axes(ax, title, xlabel, ylabel, hl=(None, None), show_highlight=False):
+    """Aplica el estilo común de ejes: resaltado del período de apagón,
+    formato de fechas, rotación de etiquetas, títulos, rejilla y leyenda,
+    reutilizando los objetos de formateo cacheados a nivel de módulo."""
+    # Opcionalmente destacar período de apagón
+    if show_highlight and hl[0] is not None:
+        ax.axvspan(hl[0], hl[1], alpha=0.2, color='yellow', label='Período de apagón')
+        # Líneas verticales para marcar claramente el inicio y fin del período
+        ax.axvline(x=hl[0], color='red', linestyle='--', alpha=0.7, label='Inicio apagón')
+        ax.axvline(x=hl[1], color='red', linestyle='--', alpha=0.7, label='Fin apagón')
+
+    # Configurar ejes y etiquetas
+    ax.xaxis.set_major_formatter(_FORMATTER)
+    ax.xaxis.set_major_locator(_LOCATOR)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+    # Títulos y leyenda
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend()
+
+def prepare_country_data(countries, window_size=7):
+    """Carga y procesa los datos diarios de varios países de una sola vez.
+
+    Devuelve un dict país → resultado de `load_and_process_data`, pensado
+    para pasarse como `precomputed` a las funciones `plot_*` y compartir el
+    mismo procesamiento entre varias gráficas. Los países se procesan en
+    hilos: la lectura de disco, el parseo JSON nativo y la agregación NumPy
+    liberan el GIL, así que el tiempo total tiende al del país más lento.
+    """
+    paths = {
+        country: os.path.join(data_dir, f"{country}_data.json")
+        for country in countries
+    }
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(paths)))) as ex:
+        futures = {
+            country: ex.submit(load_and_process_data, path, window_size)
+            for country, path in paths.items()
+        }
+        return {country: fut.result() for country, fut in futures.items()}
+
+def load_all_countries(countries, window_size=7):
+    """Carga fusionada de las series diarias y semanales de varios países.
+
+    Devuelve {'daily': ..., 'weekly': ...}: 'daily' se pasa como
+    `precomputed` a las funciones diarias y 'weekly' a plot_weekly_activity.
+    Cada país se procesa en un hilo y ambas agregaciones comparten el mismo
+    JSON ya parseado (la caché de _load_json), de modo que cada archivo se
+    lee y parsea una sola vez para todas las variantes de gráficas.
+    """
+    def _both(path):
+        return (load_and_process_data(path, window_size),
+                calculate_weekly_data(path))
+
+    paths = {
+        country: os.path.join(data_dir, f"{country}_data.json")
+        for country in countries
+    }
+    daily = {}
+    weekly = {}
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(paths)))) as ex:
+        futures = {country: ex.submit(_both, path)
+                   for country, path in paths.items()}
+        for country, fut in futures.items():
+            daily[country], weekly[country] = fut.result()
+    return {'daily': daily, 'weekly': weekly}
+
 def plot_daily_activity(
     countries=["Bangladesh", "India", "Philippines"],
     highlight_start="2024-07-17",
     highlight_end="2024-07-24",
     window_size=7,
     output_dir="output",
-    show_highlight=True  # Nuevo parámetro para mostrar/ocultar área sombreada
+    show_highlight=True,  # Parámetro para mostrar/ocultar área sombreada
+    precomputed=None  # Datos ya procesados por prepare_country_data
 ):
     """Genera gráficas de actividad diaria (commits y usuarios) a escala real para individuales."""
     # Asegurar que existe el directorio de salida
     os.makedirs(output_dir, exist_ok=True)
     
-    # Diccionarios para almacenar datos procesados y estadísticas
-    all_data = {}
-    max_commits_overall_comparative = 0
-    max_users_overall_comparative = 0
-    
     # Colores para cada país
     colors = {"Bangladesh": "blue", "India": "green", "Philippines": "purple"}
     
     # Convertir fechas de interés a objetos datetime
-    hl_start_dt = dt.datetime.strptime(highlight_start, "%Y-%m-%d")
-    hl_end_dt = dt.datetime.strptime(highlight_end, "%Y-%m-%d")
+    hl_start_dt = _parse_ymd(highlight_start)
+    hl_end_dt = _parse_ymd(highlight_end)
     
-    # Cargar y procesar datos para cada país
-    for country in countries:
-        json_file = os.path.join(data_dir, f"{country}_data.json")
-        try:
-            country_data = load_and_process_data(json_file, window_size)
-            all_data[country] = country_data
-            
-            # Actualizar máximos para escala común en gráficos comparativos
-            if country_data['commits_rolling_avg']:
-                current_max_commits = max(country_data['commits_rolling_avg'])
-                max_commits_overall_comparative = max(max_commits_overall_comparative, current_max_commits)
-            
-            if country_data['users_rolling_avg']:
-                current_max_users = max(country_data['users_rolling_avg'])
-                max_users_overall_comparative = max(max_users_overall_comparative, current_max_users)
-                
-        except FileNotFoundError:
-            print(f"Advertencia: Archivo {json_file} no encontrado.")
-            all_data[country] = {'fechas': [], 'commits_rolling_avg': [], 'users_rolling_avg': []}
+    # Cargar y procesar datos para cada país, o reutilizar los ya preparados
+    if precomputed is not None:
+        all_data = precomputed
+    else:
+        all_data = prepare_country_data(countries, window_size)
+
+    # Máximos para escala común en gráficos comparativos, una reducción por serie
+    max_commits_overall_comparative = max(
+        (np.max(d['commits_rolling_avg']) for d in all_data.values()
+         if len(d['commits_rolling_avg'])), default=0)
+    max_users_overall_comparative = max(
+        (np.max(d['users_rolling_avg']) for d in all_data.values()
+         if len(d['users_rolling_avg'])), default=0)
     
     # Generar gráficas individuales de commits diarios
     create_individual_plots(
@@ -264,127 +446,91 @@ def plot_daily_raw_activity(
     highlight_start="2024-07-17",
     highlight_end="2024-07-24",
     output_dir="output",
-    show_highlight=True
+    show_highlight=True,
+    precomputed=None  # Datos ya procesados por prepare_country_data
 ):
     """Genera gráficas de actividad diaria usando datos sin promediar."""
     # Asegurar que existe el directorio de salida
     os.makedirs(output_dir, exist_ok=True)
     
-    # Diccionarios para almacenar datos procesados y estadísticas
-    all_data = {}
-    max_commits_overall = 0
-    max_users_overall = 0
-    
     # Colores para cada país
     colors = {"Bangladesh": "blue", "India": "green", "Philippines": "purple"}
     
     # Convertir fechas de interés a objetos datetime
-    hl_start_dt = dt.datetime.strptime(highlight_start, "%Y-%m-%d")
-    hl_end_dt = dt.datetime.strptime(highlight_end, "%Y-%m-%d")
+    hl_start_dt = _parse_ymd(highlight_start)
+    hl_end_dt = _parse_ymd(highlight_end)
     
-    # Cargar y procesar datos para cada país
-    for country in countries:
-        json_file = os.path.join(data_dir, f"{country}_data.json")
-        try:
-            country_data = load_and_process_data(json_file)
-            
-            # Actualizar máximos para escala común en gráficos comparativos
-            if country_data['raw_commits']:
-                current_max = max(country_data['raw_commits'])
-                max_commits_overall = max(max_commits_overall, current_max)
-            
-            if country_data['raw_users']:
-                current_max = max(country_data['raw_users'])
-                max_users_overall = max(max_users_overall, current_max)
-                
-            all_data[country] = country_data
-        except FileNotFoundError:
-            print(f"Advertencia: Archivo {json_file} no encontrado.")
-            all_data[country] = {'fechas': [], 'raw_commits': [], 'raw_users': []}
-    
-    # Generar gráficas individuales de commits diarios (RAW)
+    # Cargar y procesar datos para cada país, o reutilizar los ya preparados
+    if precomputed is not None:
+        all_data = precomputed
+    else:
+        all_data = prepare_country_data(countries)
+
+    # Máximos para escala común en gráficos comparativos, una reducción por serie
+    max_commits_overall = max(
+        (np.max(d['raw_commits']) for d in all_data.values()
+         if len(d['raw_commits'])), default=0)
+    max_users_overall = max(
+        (np.max(d['raw_users']) for d in all_data.values()
+         if len(d['raw_users'])), default=0)
+    
+    # Generar gráficas individuales de commits diarios (RAW), reutilizando
+    # una sola figura entre países
+    fig, ax = plt.subplots(figsize=(12, 6), layout='constrained')
+
     for country, data_dict in all_data.items():
-        if not data_dict['fechas'] or not data_dict['raw_commits']:
-            print(f"No hay datos de commits para graficar de {country}.")
+        if not len(data_dict['fechas']) or not len(data_dict['raw_commits']):
+            logger.warning(f"No hay datos de commits para graficar de {country}.")
             continue
             
-        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.cla()
         
         # Graficar datos crudos como puntos y línea
         ax.plot(data_dict['fechas'], data_dict['raw_commits'], 
                marker='o', markersize=3, linestyle='-', linewidth=1, 
                color=colors.get(country, 'blue'), label='Commits diarios')
         
-        # Opcionalmente destacar período de apagón
-        if show_highlight:
-            ax.axvspan(hl_start_dt, hl_end_dt, alpha=0.2, color='yellow', label='Período de apagón')
-            # Agregar líneas verticales para marcar claramente el inicio y fin del período
-            ax.axvline(x=hl_start_dt, color='red', linestyle='--', alpha=0.7, label='Inicio apagón')
-            ax.axvline(x=hl_end_dt, color='red', linestyle='--', alpha=0.7, label='Fin apagón')
-        
         # Configurar escala local para el eje Y
-        local_max_value = max(data_dict['raw_commits']) if data_dict['raw_commits'] else 0
+        local_max_value = max(data_dict['raw_commits']) if len(data_dict['raw_commits']) else 0
         ax.set_ylim(bottom=0, top=local_max_value * 1.1 if local_max_value > 0 else 1)
         
-        # Configurar ejes y etiquetas
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=2))
-        plt.xticks(rotation=45, ha='right')
-        
-        # Títulos y leyenda
-        ax.set_title(f'Commits diarios (datos crudos) - {country}')
-        ax.set_xlabel('Fecha')
-        ax.set_ylabel('Número de Commits')
-        ax.grid(True, linestyle='--', alpha=0.7)
-        ax.legend()
+        # Estilo común de ejes, resaltado del apagón y leyenda
+        _finalize_axes(ax, f'Commits diarios (datos crudos) - {country}', 'Fecha', 'Número de Commits',
+                       hl=(hl_start_dt, hl_end_dt), show_highlight=show_highlight)
         
-        # Ajustar diseño y guardar
-        plt.tight_layout()
+        # Guardar
         output_file = os.path.join(output_dir, f"{country}_commits_raw.png")
-        plt.savefig(output_file, dpi=300)
-        plt.close(fig)
-        print(f"Figura guardada como: {output_file}")
+        fig.savefig(output_file, dpi=300)
+        logger.info(f"Figura guardada como: {output_file}")
     
-    # Generar gráfica comparativa de commits diarios (RAW)
-    fig, ax = plt.subplots(figsize=(14, 7))
-    has_data = False
+    plt.close(fig)
+
+    # Generar gráfica comparativa de commits diarios (RAW); verificar antes
+    # de construir la figura para no pagar su creación si no hay qué dibujar
+    has_data = any(len(d['fechas']) and len(d['raw_commits']) for d in all_data.values())
+    if not has_data:
+        logger.warning("No hay datos para la gráfica comparativa después del filtrado.")
+        return
+
+    fig, ax = plt.subplots(figsize=(14, 7), layout='constrained')
     
     for country, data_dict in all_data.items():
-        if data_dict['fechas'] and data_dict['raw_commits']:
+        if len(data_dict['fechas']) and len(data_dict['raw_commits']):
             ax.plot(data_dict['fechas'], data_dict['raw_commits'], 
                    marker='o', markersize=2, linestyle='-', linewidth=1, 
                    color=colors.get(country, 'blue'), label=country)
-            has_data = True
     
-    if has_data:
-        # Opcionalmente destacar período de apagón
-        if show_highlight:
-            ax.axvspan(hl_start_dt, hl_end_dt, alpha=0.2, color='yellow', label='Período de apagón')
-            ax.axvline(x=hl_start_dt, color='red', linestyle='--', alpha=0.7, label='Inicio apagón')
-            ax.axvline(x=hl_end_dt, color='red', linestyle='--', alpha=0.7, label='Fin apagón')
-        
-        # Configurar escala para el eje Y
-        ax.set_ylim(bottom=0, top=max_commits_overall * 1.1 if max_commits_overall > 0 else 1)
-        
-        # Configurar ejes y etiquetas
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=2))
-        plt.xticks(rotation=45, ha='right')
+    # Configurar escala para el eje Y
+    ax.set_ylim(bottom=0, top=max_commits_overall * 1.1 if max_commits_overall > 0 else 1)
         
-        # Títulos y leyenda
-        ax.set_title('Comparación de commits diarios (datos crudos)')
-        ax.set_xlabel('Fecha')
-        ax.set_ylabel('Número de commits')
-        ax.grid(True, linestyle='--', alpha=0.7)
-        ax.legend()
+    # Estilo común de ejes, resaltado del apagón y leyenda
+    _finalize_axes(ax, 'Comparación de commits diarios (datos crudos)', 'Fecha', 'Número de commits',
+                   hl=(hl_start_dt, hl_end_dt), show_highlight=show_highlight)
         
-        # Ajustar diseño y guardar
-        plt.tight_layout()
-        output_file = os.path.join(output_dir, "comparacion_commits_raw.png")
-        plt.savefig(output_file, dpi=300)
-        print(f"Figura comparativa guardada como: {output_file}")
-    else:
-        print("No hay datos para la gráfica comparativa después del filtrado.")
+    # Guardar
+    output_file = os.path.join(output_dir, "comparacion_commits_raw.png")
+    plt.savefig(output_file, dpi=300)
+    logger.info(f"Figura comparativa guardada como: {output_file}")
     
     plt.close(fig)
 
@@ -394,7 +540,8 @@ def plot_percentage_change(
     highlight_end="2024-07-24",
     window_size=7,
     show_highlight=True,
-    output_dir="output"
+    output_dir="output",
+    precomputed=None  # Datos ya procesados por prepare_country_data
 ):
     """Genera gráficas de cambio porcentual en actividad diaria."""
     os.makedirs(output_dir, exist_ok=True)
@@ -405,61 +552,49 @@ def plot_percentage_change(
     
     colors = {"Bangladesh": "blue", "India": "green", "Philippines": "purple"}
     
-    hl_start_dt = dt.datetime.strptime(highlight_start, "%Y-%m-%d")
-    hl_end_dt = dt.datetime.strptime(highlight_end, "%Y-%m-%d")
+    hl_start_dt = _parse_ymd(highlight_start)
+    hl_end_dt = _parse_ymd(highlight_end)
     
-    # Cargar y procesar datos para cada país
-    for country in countries:
-        json_file = os.path.join(data_dir, f"{country}_data.json")
-        try:
-            country_data = load_and_process_data(json_file, window_size)
-            
-            if not country_data['fechas'] or not country_data['commits_rolling_avg']:
-                print(f"No hay suficientes datos para {country} después del filtrado.")
-                all_data[country] = {'fechas': [], 'pct_change': []}
-                continue
-            
-            # Calcular cambio porcentual día a día
-            pct_change = []
-            fechas_pct = []
-            
-            for i in range(1, len(country_data['commits_rolling_avg'])):
-                today = country_data['commits_rolling_avg'][i]
-                yesterday = country_data['commits_rolling_avg'][i-1]
-                
-                if yesterday != 0:  # Evitar división por cero
-                    change = ((today - yesterday) / yesterday) * 100
-                else:
-                    if today == 0:
-                        change = 0
-                    else:
-                        change = 100  # Si ayer fue 0 y hoy no, consideramos un 100% de aumento
-                
-                pct_change.append(change)
-                fechas_pct.append(country_data['fechas'][i])
-            
-            all_data[country] = {
-                'fechas': fechas_pct,
-                'pct_change': pct_change
-            }
-            
-            # Actualizar límites globales
-            if pct_change:
-                current_min = min(pct_change)
-                current_max = max(pct_change)
-                min_pct_change = min(min_pct_change, current_min)
-                max_pct_change = max(max_pct_change, current_max)
-            
-        except FileNotFoundError:
-            print(f"Advertencia: Archivo {json_file} no encontrado.")
+    # Cargar y procesar datos para cada país, o reutilizar los ya preparados
+    if precomputed is not None:
+        daily_data = precomputed
+    else:
+        daily_data = prepare_country_data(countries, window_size)
+
+    for country, country_data in daily_data.items():
+        if not len(country_data['fechas']) or not len(country_data['commits_rolling_avg']):
+            logger.warning(f"No hay suficientes datos para {country} después del filtrado.")
             all_data[country] = {'fechas': [], 'pct_change': []}
+            continue
+        
+        # Calcular cambio porcentual día a día de forma vectorizada
+        a = np.asarray(country_data['commits_rolling_avg'], dtype=np.float64)
+        if njit is not None:
+            change = _pct_change(a)
+        else:
+            prev = a[:-1]
+            cur = a[1:]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # Si ayer fue 0: 0% si hoy también es 0, 100% de aumento si no
+                change = np.where(prev != 0, (cur - prev) / prev * 100.0,
+                                  np.where(cur == 0, 0.0, 100.0))
+
+        all_data[country] = {
+            'fechas': country_data['fechas'][1:],
+            'pct_change': change.tolist()
+        }
+
+        # Actualizar límites globales con una sola reducción por serie
+        if change.size:
+            min_pct_change = min(min_pct_change, change.min())
+            max_pct_change = max(max_pct_change, change.max())
     
     # Generar gráficas individuales de cambio porcentual
     for country, data_dict in all_data.items():
         if not data_dict['fechas'] or not data_dict['pct_change']:
             continue
             
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), layout='constrained')
         
         # Graficar cambio porcentual
         ax.plot(
@@ -474,43 +609,33 @@ def plot_percentage_change(
         # Agregar línea horizontal en 0% para referencia
         ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
         
-        # Opcionalmente destacar período de apagón
-        if show_highlight:
-            ax.axvspan(hl_start_dt, hl_end_dt, alpha=0.2, color='yellow', label='Período de apagón')
-            ax.axvline(x=hl_start_dt, color='red', linestyle='--', alpha=0.7, label='Inicio apagón')
-            ax.axvline(x=hl_end_dt, color='red', linestyle='--', alpha=0.7, label='Fin apagón')
-        
         # Configurar límites del eje Y con margen
         buffer = 10  # Porcentaje adicional de margen
         y_min = min(data_dict['pct_change']) - buffer
         y_max = max(data_dict['pct_change']) + buffer
         ax.set_ylim(bottom=y_min, top=y_max)
         
-        # Configurar ejes y etiquetas
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=2))
-        plt.xticks(rotation=45, ha='right')
-        
-        # Títulos y leyenda
-        ax.set_title(f'Cambio porcentual diario en commits - {country}')
-        ax.set_xlabel('Fecha')
-        ax.set_ylabel('Cambio porcentual (%)')
-        ax.grid(True, linestyle='--', alpha=0.7)
-        ax.legend()
+        # Estilo común de ejes, resaltado del apagón y leyenda
+        _finalize_axes(ax, f'Cambio porcentual diario en commits - {country}', 'Fecha', 'Cambio porcentual (%)',
+                       hl=(hl_start_dt, hl_end_dt), show_highlight=show_highlight)
         
-        # Ajustar diseño y guardar
-        plt.tight_layout()
+        # Guardar
         output_file = os.path.join(output_dir, f"{country}_cambio_porcentual.png")
         plt.savefig(output_file, dpi=300)
         plt.close(fig)
-        print(f"Figura guardada como: {output_file}")
+        logger.info(f"Figura guardada como: {output_file}")
     
-    # Generar gráfica comparativa de cambio porcentual
-    fig, ax = plt.subplots(figsize=(14, 7))
-    has_data = False
+    # Generar gráfica comparativa de cambio porcentual; verificar antes de
+    # construir la figura para no pagar su creación si no hay qué dibujar
+    has_data = any(len(d['fechas']) and len(d['pct_change']) for d in all_data.values())
+    if not has_data:
+        logger.warning("No hay datos para la gráfica comparativa de cambio porcentual.")
+        return
+
+    fig, ax = plt.subplots(figsize=(14, 7), layout='constrained')
     
     for country, data_dict in all_data.items():
-        if data_dict['fechas'] and data_dict['pct_change']:
+        if len(data_dict['fechas']) and len(data_dict['pct_change']):
             ax.plot(
                 data_dict['fechas'], 
                 data_dict['pct_change'], 
@@ -519,52 +644,37 @@ def plot_percentage_change(
                 color=colors.get(country, 'blue'), 
                 label=country
             )
-            has_data = True
     
-    if has_data:
-        # Agregar línea horizontal en 0% para referencia
-        ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-        
-        # Opcionalmente destacar período de apagón
-        if show_highlight:
-            ax.axvspan(hl_start_dt, hl_end_dt, alpha=0.2, color='yellow', label='Período de apagón')
-            ax.axvline(x=hl_start_dt, color='red', linestyle='--', alpha=0.7, label='Inicio apagón')
-            ax.axvline(x=hl_end_dt, color='red', linestyle='--', alpha=0.7, label='Fin apagón')
-        
-        # Configurar límites del eje Y con margen
-        buffer = 10  # Porcentaje adicional de margen
-        ax.set_ylim(bottom=min_pct_change-buffer, top=max_pct_change+buffer)
-        
-        # Configurar ejes y etiquetas
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=2))
-        plt.xticks(rotation=45, ha='right')
-        
-        # Títulos y leyenda
-        ax.set_title('Comparación de cambio porcentual diario en commits')
-        ax.set_xlabel('Fecha')
-        ax.set_ylabel('Cambio porcentual (%)')
-        ax.grid(True, linestyle='--', alpha=0.7)
-        ax.legend()
-        
-        # Ajustar diseño y guardar
-        plt.tight_layout()
-        output_file = os.path.join(output_dir, "comparacion_cambio_porcentual.png")
-        plt.savefig(output_file, dpi=300)
-        print(f"Figura comparativa guardada como: {output_file}")
-    else:
-        print("No hay datos para la gráfica comparativa de cambio porcentual.")
+    # Agregar línea horizontal en 0% para referencia
+    ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+    
+    # Configurar límites del eje Y con margen
+    buffer = 10  # Porcentaje adicional de margen
+    ax.set_ylim(bottom=min_pct_change-buffer, top=max_pct_change+buffer)
+    
+    # Estilo común de ejes, resaltado del apagón y leyenda
+    _finalize_axes(ax, 'Comparación de cambio porcentual diario en commits', 'Fecha', 'Cambio porcentual (%)',
+                   hl=(hl_start_dt, hl_end_dt), show_highlight=show_highlight)
+    
+    # Guardar
+    output_file = os.path.join(output_dir, "comparacion_cambio_porcentual.png")
+    plt.savefig(output_file, dpi=300)
+    logger.info(f"Figura comparativa guardada como: {output_file}")
     
     plt.close(fig)
 
-def create_individual_plots(all_data, colors, hl_start_dt, hl_end_dt, data_key, title_prefix, ylabel, filename_suffix, output_dir, show_highlight=True):
+def create_individual_plots(all_data, colors, hl_start_dt, hl_end_dt, data_key, title_prefix, ylabel, filename_suffix, output_dir, show_highlight=True, dpi=300):
     """Función auxiliar para crear gráficas individuales por país"""
+    # Una sola figura reutilizada entre países: construir Figure/Axes por
+    # gráfica es una fracción importante del costo total de matplotlib
+    fig, ax = plt.subplots(figsize=(12, 6), layout='constrained')
+
     for country, data_dict in all_data.items():
-        if not data_dict['fechas'] or not data_dict[data_key]:
-            print(f"No hay datos de {data_key} para graficar de {country} después del filtrado.")
+        if not len(data_dict['fechas']) or not len(data_dict[data_key]):
+            logger.warning(f"No hay datos de {data_key} para graficar de {country} después del filtrado.")
             continue
             
-        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.cla()
         
         # Graficar serie temporal
         ax.plot(
@@ -576,44 +686,35 @@ def create_individual_plots(all_data, colors, hl_start_dt, hl_end_dt, data_key,
             label=f'Promedio móvil (7 días)'
         )
         
-        # Opcionalmente destacar período de apagón
-        if show_highlight:
-            ax.axvspan(hl_start_dt, hl_end_dt, alpha=0.2, color='yellow', label='Período de apagón')
-            # Agregar líneas verticales para marcar claramente el inicio y fin del período
-            ax.axvline(x=hl_start_dt, color='red', linestyle='--', alpha=0.7, label='Inicio apagón')
-            ax.axvline(x=hl_end_dt, color='red', linestyle='--', alpha=0.7, label='Fin apagón')
-        
         # Configurar escala local para el eje Y
-        local_max_value = max(data_dict[data_key]) if data_dict[data_key] else 0
+        local_max_value = max(data_dict[data_key]) if len(data_dict[data_key]) else 0
         ax.set_ylim(bottom=0, top=local_max_value * 1.1 if local_max_value > 0 else 1)
         
-        # Configurar ejes y etiquetas
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=2))
-        plt.xticks(rotation=45, ha='right')
-        
-        # Títulos y leyenda
-        ax.set_title(f'{title_prefix} - {country}')
-        ax.set_xlabel('Fecha')
-        ax.set_ylabel(ylabel)
-        ax.grid(True, linestyle='--', alpha=0.7)
-        ax.legend()
+        # Estilo común de ejes, resaltado del apagón y leyenda
+        _finalize_axes(ax, f'{title_prefix} - {country}', 'Fecha', ylabel,
+                       hl=(hl_start_dt, hl_end_dt), show_highlight=show_highlight)
         
-        # Ajustar diseño y guardar
-        plt.tight_layout()
+        # Guardar
         output_file = os.path.join(output_dir, f"{country}_{filename_suffix}.png")
-        plt.savefig(output_file, dpi=300)
-        plt.close(fig)
-        print(f"Figura guardada como: {output_file}")
+        fig.savefig(output_file, dpi=dpi)
+        logger.info(f"Figura guardada como: {output_file}")
 
-def create_comparative_plot(all_data, colors, hl_start_dt, hl_end_dt, data_key, title, ylabel, max_value, filename, output_dir, show_highlight=True):
+    plt.close(fig)
+
+def create_comparative_plot(all_data, colors, hl_start_dt, hl_end_dt, data_key, title, ylabel, max_value, filename, output_dir, show_highlight=True, dpi=300):
     """Función auxiliar para crear gráficas comparativas"""
-    fig, ax = plt.subplots(figsize=(14, 7))
-    has_data = False
+    # Verificar antes de construir la figura: si ninguna serie tiene datos,
+    # evitamos todo el costo de creación de Figure/Axes
+    has_data = any(len(d['fechas']) and len(d[data_key]) for d in all_data.values())
+    if not has_data:
+        logger.warning(f"No hay datos para la gráfica comparativa {filename} después del filtrado.")
+        return
+
+    fig, ax = plt.subplots(figsize=(14, 7), layout='constrained')
     
     # Graficar series de todos los países
     for country, data_dict in all_data.items():
-        if data_dict['fechas'] and data_dict[data_key]:
+        if len(data_dict['fechas']) and len(data_dict[data_key]):
             ax.plot(
                 data_dict['fechas'], 
                 data_dict[data_key], 
@@ -622,37 +723,18 @@ def create_comparative_plot(all_data, colors, hl_start_dt, hl_end_dt, data_key,
                 color=colors.get(country, 'blue'), 
                 label=country
             )
-            has_data = True
     
-    if has_data:
-        # Opcionalmente destacar período de apagón
-        if show_highlight:
-            ax.axvspan(hl_start_dt, hl_end_dt, alpha=0.2, color='yellow', label='Período de apagón')
-            ax.axvline(x=hl_start_dt, color='red', linestyle='--', alpha=0.7, label='Inicio apagón')
-            ax.axvline(x=hl_end_dt, color='red', linestyle='--', alpha=0.7, label='Fin apagón')
-        
-        # Configurar escala para el eje Y
-        ax.set_ylim(bottom=0, top=max_value * 1.1 if max_value > 0 else 1)
-        
-        # Configurar ejes y etiquetas
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=2))
-        plt.xticks(rotation=45, ha='right')
-        
-        # Títulos y leyenda
-        ax.set_title(title)
-        ax.set_xlabel('Fecha')
-        ax.set_ylabel(ylabel)
-        ax.grid(True, linestyle='--', alpha=0.7)
-        ax.legend()
-        
-        # Ajustar diseño y guardar
-        plt.tight_layout()
-        output_file = os.path.join(output_dir, f"{filename}.png")
-        plt.savefig(output_file, dpi=300)
-        print(f"Figura comparativa guardada como: {output_file}")
-    else:
-        print(f"No hay datos para la gráfica comparativa {filename} después del filtrado.")
+    # Configurar escala para el eje Y
+    ax.set_ylim(bottom=0, top=max_value * 1.1 if max_value > 0 else 1)
+    
+    # Estilo común de ejes, resaltado del apagón y leyenda
+    _finalize_axes(ax, title, 'Fecha', ylabel,
+                   hl=(hl_start_dt, hl_end_dt), show_highlight=show_highlight)
+    
+    # Guardar
+    output_file = os.path.join(output_dir, f"{filename}.png")
+    fig.savefig(output_file, dpi=dpi)
+    logger.info(f"Figura comparativa guardada como: {output_file}")
     
     plt.close(fig)
 
@@ -661,7 +743,12 @@ def plot_weekly_activity(
     highlight_week_start="2024-W29",
     highlight_week_end="2024-W30",
     output_dir="output",
-    show_highlight=True
+    show_highlight=True,
+    dpi=150,  # El costo de rasterizado escala ~dpi²; 150 basta fuera de publicación
+    high_quality=True,  # Las comparativas (las que suelen publicarse) salen a 300 dpi
+    final=False,  # Compresión PNG máxima para artefactos de publicación
+    precomputed=None,  # Datos semanales ya procesados por load_all_countries
+    render_backend='mpl'  # 'vispy' rasteriza las comparativas en la GPU
 ):
     """Genera gráficas de actividad semanal (commits y usuarios) a escala real para individuales."""
     # Asegurar que existe el directorio de salida
@@ -669,8 +756,6 @@ def plot_weekly_activity(
     
     # Diccionarios para almacenar datos procesados y estadísticas
     all_data = {}
-    max_commits_overall_comparative = 0
-    max_users_overall_comparative = 0
     
     # Colores para cada país
     colors = {"Bangladesh": "blue", "India": "green", "Philippines": "purple"}
@@ -680,30 +765,32 @@ def plot_weekly_activity(
         try:
             date_val = mdates.num2date(x)
             year, week, _ = date_val.isocalendar()
-            return f"{year}-W{week:02d}"
+            return _week_label(year, week)
         except ValueError: 
             return ""
     
-    # Cargar y procesar datos para cada país
-    for country in countries:
-        json_file = os.path.join(data_dir, f"{country}_data.json")
-        try:
-            country_data = calculate_weekly_data(json_file)
-            all_data[country] = country_data
-            
-            # Actualizar máximos para escala común en gráficos comparativos
-            if country_data['commits']:
-                current_max_commits = max(country_data['commits'])
-                max_commits_overall_comparative = max(max_commits_overall_comparative, current_max_commits)
-            
-            if country_data['active_users']:
-                current_max_users = max(country_data['active_users'])
-                max_users_overall_comparative = max(max_users_overall_comparative, current_max_users)
-                
-        except FileNotFoundError:
-            print(f"Advertencia: Archivo {json_file} no encontrado.")
-            all_data[country] = {'fechas': [], 'commits': [], 'active_users': [], 'week_labels': []}
+    # Cargar y procesar datos para cada país, o reutilizar los ya preparados
+    if precomputed is not None:
+        all_data = precomputed
+    else:
+        for country in countries:
+            json_file = os.path.join(data_dir, f"{country}_data.json")
+            try:
+                country_data = calculate_weekly_data(json_file)
+                all_data[country] = country_data
+            except FileNotFoundError:
+                logger.warning(f"Advertencia: Archivo {json_file} no encontrado.")
+                all_data[country] = {'fechas': [], 'commits': [], 'active_users': [], 'week_labels': []}
     
+    # Máximos para escala común en gráficos comparativos, una reducción por serie
+    max_commits_overall_comparative = max(
+        (np.max(d['commits']) for d in all_data.values() if len(d['commits'])), default=0)
+    max_users_overall_comparative = max(
+        (np.max(d['active_users']) for d in all_data.values() if len(d['active_users'])), default=0)
+    
+    # Los PNG se codifican en procesos hijos mientras se arma la siguiente figura
+    async_plotter = AsyncPlotter()
+
     # Generar gráficas individuales de commits semanales
     create_weekly_individual_plots(
         all_data, 
@@ -716,7 +803,10 @@ def plot_weekly_activity(
         'commits_semanales',
         format_week_date,
         output_dir,
-        show_highlight
+        show_highlight,
+        async_plotter=async_plotter,
+        dpi=dpi,
+        final=final
     )
     
     # Generar gráficas individuales de usuarios activos semanales
@@ -731,13 +821,16 @@ def plot_weekly_activity(
         'usuarios_semanales',
         format_week_date,
         output_dir,
-        show_highlight
+        show_highlight,
+        async_plotter=async_plotter,
+        dpi=dpi,
+        final=final
     )
     
     # Encontrar país de referencia para el período de span
     ref_country_data_for_span = None
     for country, data_dict in all_data.items():
-        if data_dict['week_labels'] and data_dict['fechas']:
+        if len(data_dict['week_labels']) and len(data_dict['fechas']):
             ref_country_data_for_span = data_dict
             break
     
@@ -755,7 +848,11 @@ def plot_weekly_activity(
         format_week_date,
         ref_country_data_for_span,
         output_dir,
-        show_highlight
+        show_highlight,
+        async_plotter=async_plotter,
+        dpi=300 if high_quality else dpi,
+        final=final,
+        render_backend=render_backend
     )
     
     # Generar gráfica comparativa de usuarios activos semanales
@@ -772,54 +869,210 @@ def plot_weekly_activity(
         format_week_date,
         ref_country_data_for_span,
         output_dir,
-        show_highlight
+        show_highlight,
+        async_plotter=async_plotter,
+        dpi=300 if high_quality else dpi,
+        final=final,
+        render_backend=render_backend
     )
 
+    # Asegurar que todos los PNG terminaron de escribirse antes de volver
+    async_plotter.join()
+
+class AsyncPlotter:
+    """Guarda figuras PNG en procesos hijos para paralelizar la codificación.
+
+    `savefig` a 300 dpi está dominado por la compresión PNG, que es puro
+    CPU; cada guardado se delega a un proceso creado con fork, que hereda
+    una instantánea de la figura, mientras el proceso principal sigue
+    dibujando. En plataformas sin fork el guardado es síncrono.
+    """
+
+    def __init__(self, processes=None):
+        try:
+            self._ctx = mp.get_context('fork')
+        except ValueError:  # sin fork (p. ej. Windows): ruta síncrona
+            self._ctx = None
+        self._processes = processes if processes is not None else mp.cpu_count()
+        self._workers = []
+
+    @staticmethod
+    def _save_worker(fig, output_file, savefig_kwargs):
+        fig.savefig(output_file, **savefig_kwargs)
+        plt.close(fig)
+
+    def save(self, fig, output_file, **savefig_kwargs):
+        """Encola el guardado de `fig` en `output_file`.
+
+        El llamador puede cerrar o reutilizar la figura inmediatamente: el
+        proceso hijo trabaja sobre la copia heredada en el fork.
+        """
+        if self._ctx is None:
+            fig.savefig(output_file, **savefig_kwargs)
+            return
+        self._reap(self._processes - 1)
+        # El nombre del proceso lleva la ruta de salida para poder señalar
+        # qué PNG falló si el hijo termina con error
+        proc = self._ctx.Process(
+            target=self._save_worker, args=(fig, output_file, savefig_kwargs),
+            name=output_file)
+        proc.start()
+        self._workers.append(proc)
+
+    @staticmethod
+    def _check(worker):
+        """Avisa si un guardado terminado salió con código distinto de cero."""
+        if worker.exitcode:
+            logger.warning(
+                f"El guardado en segundo plano de {worker.name} falló "
+                f"(código {worker.exitcode}); el PNG puede faltar o estar incompleto.")
+
+    def _reap(self, limit):
+        """Espera hasta que queden a lo sumo `limit` guardados en vuelo."""
+        while True:
+            alive = []
+            for worker in self._workers:
+                if worker.is_alive():
+                    alive.append(worker)
+                else:
+                    self._check(worker)
+            self._workers = alive
+            if len(self._workers) <= limit:
+                return
+            self._workers[0].join(0.05)
+
+    def join(self):
+        """Espera a que terminen todos los guardados pendientes y revisa
+        que ninguno haya fallado."""
+        for worker in self._workers:
+            worker.join()
+            self._check(worker)
+        self._workers = []
+
+def m4_downsample(x, y, width_px):
+    """Submuestreo M4: conserva (primero, mínimo, máximo, último) por columna
+    de píxel. El resultado rasteriza idéntico pero con a lo sumo 4*width_px
+    vértices, y el trazado de líneas en Agg escala con los vértices dibujados."""
+    y = np.asarray(y)
+    n = len(y)
+    if width_px <= 0 or n <= 4 * width_px:
+        return x, y
+    x = np.asarray(x)
+    xn = mdates.date2num(x)
+    # x viene ordenado, así que los índices de bin son no decrecientes y los
+    # límites de segmento salen de los cambios de valor
+    bins = np.digitize(xn, np.linspace(xn[0], xn[-1], width_px + 1)[1:-1])
+    change = np.flatnonzero(np.diff(bins)) + 1
+    starts = np.concatenate(([0], change))
+    ends = np.concatenate((change - 1, [n - 1]))
+    # Orden estable por (bin, y): el primer/último elemento de cada segmento
+    # es el argmin/argmax del bin sin iterar en Python
+    perm = np.lexsort((y, bins))
+    keep = np.unique(np.concatenate((starts, ends, perm[starts], perm[ends])))
+    return x[keep], y[keep]
+
 def create_weekly_individual_plots(all_data, colors, highlight_week_start, highlight_week_end, 
                                   data_key, title_prefix, ylabel, filename_suffix, date_formatter, 
-                                  output_dir, show_highlight=True):
-    """Función auxiliar para crear gráficas individuales semanales por país"""
-    for country, data_dict in all_data.items():
-        if not data_dict['fechas'] or not data_dict[data_key]:
-            print(f"No hay datos de {data_key} semanales para graficar de {country} después del filtrado.")
+                                  output_dir, show_highlight=True, async_plotter=None, dpi=150,
+                                  final=False, stride=None):
+    """Función auxiliar para crear gráficas individuales semanales por país
+
+    `stride` emite solo cada n-ésimo país: útil para iterar rápido durante
+    el desarrollo sin tocar el cálculo. Por defecto sale de la variable de
+    entorno PLOT_STRIDE (1 = todos los países; CI corre con PLOT_STRIDE=3).
+    """
+    if stride is None:
+        stride = int(os.environ.get('PLOT_STRIDE', '1'))
+    # Compresión PNG rápida (zlib nivel 1) para artefactos intermedios; con
+    # `final` se paga la compresión máxima solo para material de publicación
+    pil_kwargs = ({'compress_level': 9, 'optimize': True} if final
+                  else {'compress_level': 1, 'optimize': False})
+    # Una sola figura reutilizada entre países: construir Figure/Axes cada
+    # vez paga de nuevo ejes, ticks y maquinaria de leyenda
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    # Formateador y localizador construidos una sola vez y compartidos por
+    # todas las iteraciones
+    fmt = plt.FuncFormatter(date_formatter)
+    loc = mdates.WeekdayLocator(byweekday=mdates.MO, interval=2)
+
+    # Un solo parche de resaltado cuya extensión en x se muta por país;
+    # crear un parche nuevo por gráfica invalida transformaciones y
+    # re-registra el artista en los ejes cada vez. axvspan devuelve un
+    # Polygon en matplotlib < 3.10 y un Rectangle desde entonces; ambos se
+    # mutan en coordenadas mezcladas (x en datos, y en ejes)
+    span = ax.axvspan(0, 1, alpha=0.2, color='yellow')
+    span.set_visible(False)
+    span.set_label('_nolegend_')
+
+    # Ancho del eje en píxeles para el submuestreo M4
+    width_px = int(fig.get_size_inches()[0] * dpi)
+
+    # Márgenes fijos aplicados una sola vez: tight_layout mide cada texto de
+    # la figura en cada llamada, y aquí el contenido es siempre el mismo
+    fig.subplots_adjust(left=0.08, right=0.97, bottom=0.18, top=0.92)
+
+    # Prefijo de ruta fijo: evita os.path.join por país en el bucle
+    out_prefix = os.fspath(output_dir) + os.sep
+
+    for idx, (country, data_dict) in enumerate(all_data.items()):
+        if idx % stride:
+            continue
+        if not len(data_dict['fechas']) or not len(data_dict[data_key]):
+            logger.warning(f"No hay datos de {data_key} semanales para graficar de {country} después del filtrado.")
             continue
             
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        # Graficar serie temporal
+        # Quitar solo las líneas del país anterior; los demás artistas
+        # (parche de resaltado, ejes, ticks) se reutilizan tal cual
+        for line in list(ax.get_lines()):
+            line.remove()
+
+        # Graficar serie temporal (submuestreada si excede el ancho en píxeles)
+        xs, ys = m4_downsample(data_dict['fechas'], data_dict[data_key], width_px)
         ax.plot(
-            data_dict['fechas'], 
-            data_dict[data_key], 
+            xs, 
+            ys, 
             linestyle='-', 
             linewidth=2.5, 
             color=colors.get(country, 'blue'), 
             label=f'{title_prefix.split(" ")[0]} semanales'
         )
+        # Límites x explícitos: fechas viene ordenado, así que los extremos
+        # son O(1) y se evita el recorrido de autoescala que dispararía el
+        # parche de resaltado
+        ax.set_xlim(data_dict['fechas'][0], data_dict['fechas'][-1])
+        ax.set_autoscalex_on(False)
         
-        # Opcionalmente destacar período de apagón
-        if show_highlight:
-            highlight_indices = []
-            if data_dict['week_labels']:
-                for i, week_label in enumerate(data_dict['week_labels']):
-                    if highlight_week_start <= week_label <= highlight_week_end:
-                        highlight_indices.append(i)
-            
-            if highlight_indices and data_dict['fechas'] and highlight_indices[-1] < len(data_dict['fechas']):
-                min_idx = min(highlight_indices)
-                max_idx = max(highlight_indices)
-                if min_idx < len(data_dict['fechas']):
-                    start_date_span = data_dict['fechas'][min_idx]
-                    end_date_span = data_dict['fechas'][max_idx] + dt.timedelta(days=7)
-                    ax.axvspan(start_date_span, end_date_span, alpha=0.2, color='yellow', label='Período de apagón')
+        # Opcionalmente destacar período de apagón: las etiquetas ISO
+        # "YYYY-Www" ordenan lexicográficamente igual que cronológicamente,
+        # así que el rango sale de dos búsquedas binarias
+        span.set_visible(False)
+        span.set_label('_nolegend_')
+        if show_highlight and len(data_dict['week_labels']):
+            labels = np.asarray(data_dict['week_labels'])
+            min_idx = np.searchsorted(labels, highlight_week_start, side='left')
+            max_idx = np.searchsorted(labels, highlight_week_end, side='right') - 1
+            if min_idx <= max_idx < len(data_dict['fechas']):
+                start_x = mdates.date2num(data_dict['fechas'][min_idx])
+                end_x = mdates.date2num(data_dict['fechas'][max_idx] + ONE_WEEK)
+                if isinstance(span, plt.Rectangle):
+                    span.set_x(start_x)
+                    span.set_width(end_x - start_x)
+                else:
+                    span.set_xy([[start_x, 0], [start_x, 1],
+                                 [end_x, 1], [end_x, 0], [start_x, 0]])
+                span.set_visible(True)
+                span.set_label('Período de apagón')
         
-        # Configurar escala local para el eje Y
-        local_max_value = max(data_dict[data_key]) if data_dict[data_key] else 0
+        # Configurar escala local para el eje Y (una reducción en C)
+        arr = np.asarray(data_dict[data_key])
+        local_max_value = arr.max() if arr.size else 0
         ax.set_ylim(bottom=0, top=local_max_value * 1.1 if local_max_value > 0 else 1)
         
         # Configurar ejes y etiquetas
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(date_formatter))
-        ax.xaxis.set_major_locator(mdates.WeekdayLocator(byweekday=mdates.MO, interval=2))
-        plt.xticks(rotation=45, ha='right')
+        ax.xaxis.set_major_formatter(fmt)
+        ax.xaxis.set_major_locator(loc)
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
         
         # Títulos y leyenda
         ax.set_title(f'{title_prefix} - {country}')
@@ -828,56 +1081,126 @@ def create_weekly_individual_plots(all_data, colors, highlight_week_start, highl
         ax.grid(True, linestyle='--', alpha=0.7)
         ax.legend()
         
-        # Ajustar diseño y guardar
-        plt.tight_layout()
-        output_file = os.path.join(output_dir, f"{country}_{filename_suffix}.png")
-        plt.savefig(output_file, dpi=300)
-        plt.close(fig)
-        print(f"Figura guardada como: {output_file}")
+        output_file = f"{out_prefix}{country}_{filename_suffix}.png"
+        if async_plotter is not None:
+            # La codificación PNG corre en un proceso hijo sobre la copia
+            # heredada en el fork; el padre puede reutilizar la figura ya
+            async_plotter.save(fig, output_file, dpi=dpi, pil_kwargs=pil_kwargs)
+        else:
+            fig.savefig(output_file, dpi=dpi, pil_kwargs=pil_kwargs)
+        logger.info(f"Figura guardada como: {output_file}")
+
+    plt.close(fig)
+
+def _render_comparative_vispy(all_data, colors, data_key, max_value,
+                              span_bounds, output_file, size=(1400, 700)):
+    """Dibuja la comparativa con VisPy y exporta el lienzo renderizado a PNG.
+
+    El rasterizado corre en la GPU; una Line por país con los vértices en
+    float32 y una LinearRegion para el período de apagón mantienen paridad
+    visual con la versión de matplotlib para las vistas interactivas.
+    """
+    canvas = _vispy_scene.SceneCanvas(size=size, show=False, bgcolor='white')
+    view = canvas.central_widget.add_view()
+    view.camera = 'panzoom'
+    x_min = x_max = None
+    for country, data_dict in all_data.items():
+        if len(data_dict['fechas']) and len(data_dict[data_key]):
+            xn = mdates.date2num(np.asarray(data_dict['fechas']))
+            pos = np.c_[xn, np.asarray(data_dict[data_key])].astype(np.float32)
+            _vispy_scene.Line(pos=pos, color=colors.get(country, 'blue'),
+                              width=2.5, parent=view.scene)
+            x_min = xn[0] if x_min is None else min(x_min, xn[0])
+            x_max = xn[-1] if x_max is None else max(x_max, xn[-1])
+    if x_min is None:
+        canvas.close()
+        return False
+    if span_bounds is not None:
+        _vispy_scene.LinearRegion(
+            pos=np.array([mdates.date2num(span_bounds[0]),
+                          mdates.date2num(span_bounds[1])], dtype=np.float32),
+            color=(1.0, 1.0, 0.0, 0.2), parent=view.scene)
+    view.camera.set_range(x=(x_min, x_max),
+                          y=(0, max_value * 1.1 if max_value > 0 else 1))
+    img = canvas.render()
+    plt.imsave(output_file, img)
+    canvas.close()
+    return True
 
 def create_weekly_comparative_plot(all_data, colors, highlight_week_start, highlight_week_end, 
                                   data_key, title, ylabel, max_value, filename, date_formatter, 
-                                  ref_country_data, output_dir, show_highlight=True):
-    """Función auxiliar para crear gráficas comparativas semanales"""
+                                  ref_country_data, output_dir, show_highlight=True,
+                                  async_plotter=None, dpi=150, final=False,
+                                  render_backend='mpl'):
+    """Función auxiliar para crear gráficas comparativas semanales
+
+    `render_backend` puede ser 'mpl' (por defecto, salida estática) o
+    'vispy' (rasterizado en GPU, para las variantes de inspección
+    interactiva); sin vispy instalado se avisa y se usa matplotlib.
+    """
+    # Límites del período de apagón, compartidos por ambos backends
+    span_bounds = None
+    if show_highlight and ref_country_data and len(ref_country_data['week_labels']):
+        labels = np.asarray(ref_country_data['week_labels'])
+        min_idx = np.searchsorted(labels, highlight_week_start, side='left')
+        max_idx = np.searchsorted(labels, highlight_week_end, side='right') - 1
+        if min_idx <= max_idx < len(ref_country_data['fechas']):
+            span_bounds = (ref_country_data['fechas'][min_idx],
+                           ref_country_data['fechas'][max_idx] + ONE_WEEK)
+
+    if render_backend == 'vispy':
+        if _vispy_scene is None:
+            logger.warning("VisPy no está instalado; se usa matplotlib para la gráfica comparativa.")
+        else:
+            output_file = f"{os.fspath(output_dir)}{os.sep}{filename}.png"
+            if _render_comparative_vispy(all_data, colors, data_key, max_value,
+                                         span_bounds, output_file):
+                logger.info(f"Figura comparativa guardada como: {output_file}")
+            else:
+                logger.warning(f"No hay datos para la gráfica comparativa {filename} después del filtrado.")
+            return
+
+    pil_kwargs = ({'compress_level': 9, 'optimize': True} if final
+                  else {'compress_level': 1, 'optimize': False})
     fig, ax = plt.subplots(figsize=(14, 7))
     has_data = False
+    width_px = int(fig.get_size_inches()[0] * dpi)
+    x_min = x_max = None
     
     # Graficar series de todos los países
     for country, data_dict in all_data.items():
-        if data_dict['fechas'] and data_dict[data_key]:
+        if len(data_dict['fechas']) and len(data_dict[data_key]):
+            xs, ys = m4_downsample(data_dict['fechas'], data_dict[data_key], width_px)
             ax.plot(
-                data_dict['fechas'], 
-                data_dict[data_key], 
+                xs, 
+                ys, 
                 linestyle='-', 
                 linewidth=2.5, 
                 color=colors.get(country, 'blue'), 
                 label=country
             )
+            # Acumular límites x mirando solo los extremos de cada serie
+            first, last = data_dict['fechas'][0], data_dict['fechas'][-1]
+            x_min = first if x_min is None else min(x_min, first)
+            x_max = last if x_max is None else max(x_max, last)
             has_data = True
     
     if has_data:
-        # Opcionalmente destacar período de apagón
-        if show_highlight and ref_country_data:
-            highlight_indices_comp = []
-            for i, week_label in enumerate(ref_country_data['week_labels']):
-                if highlight_week_start <= week_label <= highlight_week_end:
-                    highlight_indices_comp.append(i)
-            
-            if highlight_indices_comp and ref_country_data['fechas'] and highlight_indices_comp[-1] < len(ref_country_data['fechas']):
-                min_idx = min(highlight_indices_comp)
-                max_idx = max(highlight_indices_comp)
-                if min_idx < len(ref_country_data['fechas']):
-                    start_date_span = ref_country_data['fechas'][min_idx]
-                    end_date_span = ref_country_data['fechas'][max_idx] + dt.timedelta(days=7)
-                    ax.axvspan(start_date_span, end_date_span, alpha=0.2, color='yellow', label='Período de apagón')
+        ax.set_xlim(x_min, x_max)
+        ax.set_autoscalex_on(False)
+        # Opcionalmente destacar período de apagón (límites ya calculados
+        # arriba con las mismas búsquedas binarias que las individuales)
+        if span_bounds is not None:
+            ax.axvspan(span_bounds[0], span_bounds[1], alpha=0.2, color='yellow', label='Período de apagón')
         
         # Configurar escala para el eje Y
         ax.set_ylim(bottom=0, top=max_value * 1.1 if max_value > 0 else 1)
         
-        # Configurar ejes y etiquetas
+        # Configurar ejes y etiquetas (sin pasar por la máquina de estados
+        # de pyplot)
         ax.xaxis.set_major_formatter(plt.FuncFormatter(date_formatter))
         ax.xaxis.set_major_locator(mdates.WeekdayLocator(byweekday=mdates.MO, interval=2))
-        plt.xticks(rotation=45, ha='right')
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
         
         # Títulos y leyenda
         ax.set_title(title)
@@ -886,13 +1209,16 @@ def create_weekly_comparative_plot(all_data, colors, highlight_week_start, highl
         ax.grid(True, linestyle='--', alpha=0.7)
         ax.legend()
         
-        # Ajustar diseño y guardar
-        plt.tight_layout()
-        output_file = os.path.join(output_dir, f"{filename}.png")
-        plt.savefig(output_file, dpi=300)
-        print(f"Figura comparativa guardada como: {output_file}")
+        # Márgenes fijos en lugar de tight_layout (ver la gráfica individual)
+        fig.subplots_adjust(left=0.08, right=0.97, bottom=0.18, top=0.92)
+        output_file = f"{os.fspath(output_dir)}{os.sep}{filename}.png"
+        if async_plotter is not None:
+            async_plotter.save(fig, output_file, dpi=dpi, pil_kwargs=pil_kwargs)
+        else:
+            plt.savefig(output_file, dpi=dpi, pil_kwargs=pil_kwargs)
+        logger.info(f"Figura comparativa guardada como: {output_file}")
     else:
-        print(f"No hay datos para la gráfica comparativa {filename} después del filtrado.")
+        logger.warning(f"No hay datos para la gráfica comparativa {filename} después del filtrado.")
     
     plt.close(fig)
 
@@ -912,53 +1238,65 @@ if __name__ == "__main__":
     # Crear directorio de salida
     os.makedirs(output_plots_dir, exist_ok=True)
     
+    # Cargar y preprocesar todas las series (diarias y semanales) en un solo
+    # barrido: las variantes de gráficas solo difieren en el renderizado,
+    # no en los datos
+    all_series = load_all_countries(countries_list, window_size=7)
+    daily_data = all_series['daily']
+    
     # Generar diferentes visualizaciones
-    print("Generando gráficas de actividad diaria (datos crudos)...")
+    logger.info("Generando gráficas de actividad diaria (datos crudos)...")
     plot_daily_raw_activity(
         countries=countries_list,
         highlight_start=highlight_start_date,
         highlight_end=highlight_end_date,
-        output_dir=output_plots_dir
+        output_dir=output_plots_dir,
+        precomputed=daily_data
     )
     
-    print("\nGenerando gráficas de actividad diaria con promedios móviles...")
+    logger.info("Generando gráficas de actividad diaria con promedios móviles...")
     plot_daily_activity(
         countries=countries_list,
         highlight_start=highlight_start_date,
         highlight_end=highlight_end_date,
         window_size=7,
-        output_dir=output_plots_dir
+        output_dir=output_plots_dir,
+        precomputed=daily_data
     )
     
     # También generar gráficas sin área sombreada
     sin_sombra_dir = os.path.join(output_plots_dir, "sin_sombreado")
     os.makedirs(sin_sombra_dir, exist_ok=True)
     
-    print("\nGenerando gráficas de actividad diaria sin área sombreada...")
+    logger.info("Generando gráficas de actividad diaria sin área sombreada...")
     plot_daily_activity(
         countries=countries_list,
         highlight_start=highlight_start_date,
         highlight_end=highlight_end_date,
         window_size=7,
         output_dir=sin_sombra_dir,
-        show_highlight=False
+        show_highlight=False,
+        precomputed=daily_data
     )
     
-    print("\nGenerando gráficas de cambio porcentual...")
+    logger.info("Generando gráficas de cambio porcentual...")
     plot_percentage_change(
         countries=countries_list,
         highlight_start=highlight_start_date,
         highlight_end=highlight_end_date,
         window_size=7,
-        output_dir=output_plots_dir
+        output_dir=output_plots_dir,
+        precomputed=daily_data
     )
     
-    print("\nGenerando gráficas de actividad semanal...")
+    logger.info("Generando gráficas de actividad semanal...")
     plot_weekly_activity(
         countries=countries_list,
         highlight_week_start=highlight_week_start_label,
         highlight_week_end=highlight_week_end_label,
-        output_dir=output_plots_dir
+        output_dir=output_plots_dir,
+        precomputed=all_series['weekly']
     )
     
-    print("\nTodas las gráficas han sido generadas correctamente.")
\ No newline at end of file
+    logger.info("Todas las gráficas han sido generadas correctamente.")
+    logging.shutdown()  # descarga el búfer del logger una sola vez
\ No newline at end of file